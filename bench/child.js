@@ -0,0 +1,10 @@
+// Runs the CLI in this process and, on exit, writes its peak RSS to the
+// file named by BENCH_STATS so the parent can read it back.
+import { writeFileSync } from "fs";
+
+process.on("exit", () => {
+  const { maxRSS } = process.resourceUsage();
+  writeFileSync(process.env.BENCH_STATS, JSON.stringify({ maxRSS }));
+});
+
+await import("../bin/cli.js");
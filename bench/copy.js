@@ -0,0 +1,236 @@
+#!/usr/bin/env node
+// Benchmarks the copy/sync paths of `init` and `add` against synthetic skill
+// trees and records wall time, throughput and peak RSS per scenario.
+//
+//   node bench/copy.js [--shape large,tiny,deep] [--runs 3]
+//                      [--source pack|dir] [--json] [--save file]
+//                      [--baseline file] [--tolerance 0.25]
+//                      [--skills N --files N --bytes N --depth N]
+//
+// Scenarios, each in a fresh node process:
+//   init   `init` into an empty project
+//   rerun  `init` again over the previous install (full rewrite)
+//   sync   `init --sync` over an up-to-date install (should be a no-op)
+//   add    `add` half of the skills into an empty project
+//
+// Throughput counts every skill file the command had to consider (written
+// or verified) across both targets. With --baseline, exits 1 if any median
+// time or peak RSS is worse than the baseline by more than the tolerance.
+import { spawnSync } from "child_process";
+import { fileURLToPath } from "url";
+import { dirname, join } from "path";
+import { cpus, tmpdir } from "os";
+import fs from "fs/promises";
+import { parseArgs } from "util";
+import { createSkillHome, SHAPES } from "../scripts/fixtures.js";
+
+const CHILD = join(dirname(fileURLToPath(import.meta.url)), "child.js");
+
+const { values: args } = parseArgs({
+  options: {
+    shape: { type: "string", default: Object.keys(SHAPES).join(",") },
+    runs: { type: "string", default: "3" },
+    source: { type: "string", default: "pack" },
+    json: { type: "boolean", default: false },
+    save: { type: "string" },
+    baseline: { type: "string" },
+    tolerance: { type: "string", default: "0.25" },
+    skills: { type: "string" },
+    files: { type: "string" },
+    bytes: { type: "string" },
+    depth: { type: "string" },
+  },
+});
+
+function selectShapes() {
+  const custom = ["skills", "files", "bytes", "depth"].filter((k) => args[k]);
+  if (custom.length > 0) {
+    const shape = { skills: 10, files: 50, bytes: 1024, depth: 1 };
+    for (const key of custom) shape[key] = Number(args[key]);
+    return { custom: shape };
+  }
+
+  const shapes = {};
+  for (const name of args.shape.split(",")) {
+    if (!SHAPES[name]) {
+      throw new Error(`Unknown shape ${name}. Use ${Object.keys(SHAPES)}.`);
+    }
+    shapes[name] = SHAPES[name];
+  }
+  return shapes;
+}
+
+function runCli(cliArgs, cwd, home, statsFile) {
+  const start = process.hrtime.bigint();
+  const child = spawnSync(process.execPath, [CHILD, ...cliArgs], {
+    cwd,
+    env: { ...process.env, SOLO_DEV_SKILLS_HOME: home, BENCH_STATS: statsFile },
+    encoding: "utf8",
+  });
+  const ms = Number(process.hrtime.bigint() - start) / 1e6;
+  if (child.status !== 0) {
+    throw new Error(`${cliArgs.join(" ")} failed:\n${child.stderr}`);
+  }
+  return ms;
+}
+
+async function benchShape(work, name, shape, runs) {
+  const { root: home, catalog } = await createSkillHome(join(work, name), {
+    ...shape,
+    pack: args.source === "pack",
+  });
+  const count = (skills) => ({
+    files: skills.reduce((n, s) => n + s.files, 0) * 2,
+    bytes: skills.reduce((n, s) => n + s.bytes, 0) * 2,
+  });
+  const half = catalog.skills.slice(0, Math.max(1, catalog.skills.length / 2));
+  const statsFile = join(work, "stats.json");
+
+  let project;
+  let projects = 0;
+  const freshProject = async () => {
+    project = join(work, `${name}-project-${projects++}`);
+    await fs.mkdir(project);
+    return project;
+  };
+
+  const scenarios = {
+    init: { prepare: freshProject, args: ["init"], ...count(catalog.skills) },
+    rerun: { args: ["init"], ...count(catalog.skills) },
+    sync: { args: ["init", "--sync"], ...count(catalog.skills) },
+    add: {
+      prepare: freshProject,
+      args: ["add", ...half.map((s) => s.name)],
+      ...count(half),
+    },
+  };
+
+  const results = {};
+  for (const [scenario, spec] of Object.entries(scenarios)) {
+    const samples = [];
+    let peakRss = 0;
+    for (let i = 0; i < runs; i++) {
+      if (spec.prepare) await spec.prepare();
+      // rerun and sync always follow an init into the current project.
+      else if (!project) await freshProject();
+      samples.push(runCli(spec.args, project, home, statsFile));
+      const { maxRSS } = JSON.parse(await fs.readFile(statsFile, "utf8"));
+      peakRss = Math.max(peakRss, maxRSS);
+    }
+    samples.sort((a, b) => a - b);
+    const ms = samples[Math.floor(samples.length / 2)];
+    results[scenario] = {
+      ms: Math.round(ms * 10) / 10,
+      files: spec.files,
+      bytes: spec.bytes,
+      filesPerSec: Math.round(spec.files / (ms / 1000)),
+      mbPerSec: Math.round((spec.bytes / 1024 / 1024 / (ms / 1000)) * 10) / 10,
+      peakRssMb: Math.round((peakRss / 1024) * 10) / 10,
+    };
+  }
+  return results;
+}
+
+function printResults(results) {
+  const rows = [["Shape", "Scenario", "ms", "files/s", "MB/s", "RSS MB"]];
+  for (const [shape, scenarios] of Object.entries(results)) {
+    for (const [scenario, r] of Object.entries(scenarios)) {
+      const { ms, filesPerSec, mbPerSec, peakRssMb } = r;
+      rows.push([shape, scenario, ms, filesPerSec, mbPerSec, peakRssMb]);
+    }
+  }
+  printTable(rows);
+}
+
+function printTable(rows) {
+  const widths = rows[0].map((_, c) =>
+    Math.max(...rows.map((row) => String(row[c]).length))
+  );
+  for (const row of rows) {
+    const cells = row.map((cell, c) =>
+      c < 2
+        ? String(cell).padEnd(widths[c])
+        : String(cell).padStart(widths[c])
+    );
+    console.log(`  ${cells.join("  ")}`);
+  }
+}
+
+function compare(results, baseline, tolerance) {
+  const percent = (now, before) =>
+    `${now >= before ? "+" : ""}${Math.round((now / before - 1) * 100)}%`;
+  const rows = [["Shape", "Scenario", "ms", "Δ ms", "RSS MB", "Δ RSS"]];
+  const regressions = [];
+
+  for (const [shape, scenarios] of Object.entries(results)) {
+    for (const [scenario, now] of Object.entries(scenarios)) {
+      const before = baseline.results?.[shape]?.[scenario];
+      if (!before) continue;
+      rows.push([
+        shape,
+        scenario,
+        now.ms,
+        percent(now.ms, before.ms),
+        now.peakRssMb,
+        percent(now.peakRssMb, before.peakRssMb),
+      ]);
+      if (
+        now.ms > before.ms * (1 + tolerance) ||
+        now.peakRssMb > before.peakRssMb * (1 + tolerance)
+      ) {
+        regressions.push(`${shape}/${scenario}`);
+      }
+    }
+  }
+
+  if (!args.json) {
+    console.log(`\nCompared with baseline (tolerance ${tolerance * 100}%):\n`);
+    printTable(rows);
+  }
+  return regressions;
+}
+
+const work = await fs.mkdtemp(join(tmpdir(), "solo-dev-skills-bench-"));
+try {
+  const runs = Number(args.runs);
+  const results = {};
+  for (const [name, shape] of Object.entries(selectShapes())) {
+    results[name] = await benchShape(work, name, shape, runs);
+  }
+
+  const report = {
+    node: process.version,
+    platform: `${process.platform}-${process.arch}`,
+    cpus: cpus().length,
+    source: args.source,
+    runs,
+    results,
+  };
+
+  if (args.json) {
+    console.log(JSON.stringify(report, null, 2));
+  } else {
+    console.log(`Copy benchmark (${args.source} source, median of ${runs}):\n`);
+    printResults(results);
+  }
+
+  if (args.save) {
+    await fs.writeFile(args.save, `${JSON.stringify(report, null, 2)}\n`);
+  }
+
+  if (args.baseline) {
+    const baseline = JSON.parse(await fs.readFile(args.baseline, "utf8"));
+    if (baseline.source !== args.source) {
+      console.warn(
+        `! Baseline used the ${baseline.source} source, this run ${args.source}`
+      );
+    }
+    const regressions = compare(results, baseline, Number(args.tolerance));
+    if (regressions.length > 0) {
+      console.error(`\n✗ Regressed: ${regressions.join(", ")}`);
+      process.exitCode = 1;
+    }
+  }
+} finally {
+  await fs.rm(work, { recursive: true, force: true });
+}
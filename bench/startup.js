@@ -0,0 +1,130 @@
+#!/usr/bin/env node
+// Measures cold wall time of `--version`, `list` and `init`, each in a fresh
+// node process. By default the skills come from a skills.pack, as in the
+// published package; `--source dir` measures a checkout's loose tree instead.
+//
+//   node bench/startup.js [--runs 20] [--source pack|dir] [--json]
+//                         [--save file] [--baseline file] [--tolerance 0.25]
+//
+// With --baseline, exits 1 if any median is slower than the baseline median
+// by more than the tolerance.
+import { spawnSync } from "child_process";
+import { fileURLToPath } from "url";
+import { dirname, join } from "path";
+import { tmpdir } from "os";
+import fs from "fs/promises";
+import { parseArgs } from "util";
+import { createSkillHome } from "../scripts/fixtures.js";
+
+const CLI = join(dirname(fileURLToPath(import.meta.url)), "../bin/cli.js");
+
+const { values: args } = parseArgs({
+  options: {
+    runs: { type: "string", default: "20" },
+    source: { type: "string", default: "pack" },
+    json: { type: "boolean", default: false },
+    save: { type: "string" },
+    baseline: { type: "string" },
+    tolerance: { type: "string", default: "0.25" },
+  },
+});
+
+function time(cliArgs, cwd, env) {
+  const start = process.hrtime.bigint();
+  const child = spawnSync(process.execPath, [CLI, ...cliArgs], {
+    cwd,
+    env,
+    encoding: "utf8",
+  });
+  const ms = Number(process.hrtime.bigint() - start) / 1e6;
+  if (child.status !== 0) {
+    throw new Error(`${cliArgs.join(" ")} failed:\n${child.stderr}`);
+  }
+  return ms;
+}
+
+function summarize(samples) {
+  const sorted = [...samples].sort((a, b) => a - b);
+  const round = (n) => Math.round(n * 100) / 100;
+  return {
+    min: round(sorted[0]),
+    median: round(sorted[Math.floor(sorted.length / 2)]),
+    mean: round(sorted.reduce((a, b) => a + b, 0) / sorted.length),
+    max: round(sorted[sorted.length - 1]),
+  };
+}
+
+const work = await fs.mkdtemp(join(tmpdir(), "solo-dev-skills-startup-"));
+try {
+  const { root: home } = await createSkillHome(join(work, "home"), {
+    skills: 10,
+    files: 20,
+    bytes: 2048,
+    pack: args.source === "pack",
+  });
+  const env = { ...process.env, SOLO_DEV_SKILLS_HOME: home };
+  const runs = Number(args.runs);
+
+  const scenarios = {
+    version: () => time(["--version"], work, env),
+    list: () => time(["list"], work, env),
+    init: async (i) => {
+      const cwd = join(work, `project-${i}`);
+      await fs.mkdir(cwd);
+      return time(["init"], cwd, env);
+    },
+  };
+
+  const results = {};
+  for (const [name, run] of Object.entries(scenarios)) {
+    await run(-1); // warm the OS file cache, not the process
+    const samples = [];
+    for (let i = 0; i < runs; i++) samples.push(await run(i));
+    results[name] = summarize(samples);
+  }
+
+  const report = { source: args.source, runs, results };
+
+  if (args.json) {
+    console.log(JSON.stringify(report, null, 2));
+  } else {
+    console.log(
+      `Cold startup (${args.source} source) over ${runs} runs (ms):\n`
+    );
+    for (const [name, r] of Object.entries(results)) {
+      console.log(
+        `  ${name.padEnd(8)} median ${String(r.median).padStart(8)}` +
+          `  min ${String(r.min).padStart(8)}  max ${String(r.max).padStart(8)}`
+      );
+    }
+  }
+
+  if (args.save) {
+    await fs.writeFile(args.save, `${JSON.stringify(report, null, 2)}\n`);
+  }
+
+  if (args.baseline) {
+    const saved = JSON.parse(await fs.readFile(args.baseline, "utf8"));
+    // Baselines saved before --source existed hold the results directly.
+    const baseline = saved.results ?? saved;
+    const source = saved.source ?? "dir";
+    if (source !== args.source) {
+      console.warn(
+        `! Baseline used the ${source} source, this run ${args.source}`
+      );
+    }
+    const limit = 1 + Number(args.tolerance);
+    const regressions = Object.keys(results).filter(
+      (name) =>
+        baseline[name] && results[name].median > baseline[name].median * limit
+    );
+    for (const name of regressions) {
+      console.error(
+        `✗ ${name}: median ${results[name].median}ms vs baseline ${baseline[name].median}ms`
+      );
+    }
+    if (regressions.length > 0) process.exitCode = 1;
+  }
+} finally {
+  await fs.rm(work, { recursive: true, force: true });
+}
@@ -1,13 +1,35 @@
 #!/usr/bin/env node
-import { Command } from "commander";
-import { init, add, list } from "../src/commands/init.js";
+const VERSION = "1.0.0";
+
+// Scripts and git hooks call `--version` often; answer it before loading
+// commander or any command module.
+const argv = process.argv.slice(2);
+if (argv.length === 1 && (argv[0] === "--version" || argv[0] === "-V")) {
+  console.log(VERSION);
+  process.exit(0);
+}
+
+const { Command, InvalidArgumentError } = await import("commander");
+
+// Command modules are imported only when their subcommand is dispatched.
+function lazy(path, name) {
+  return async (...args) => (await import(path))[name](...args);
+}
+
+function parseJobs(value) {
+  const jobs = Number(value);
+  if (!Number.isInteger(jobs) || jobs < 1) {
+    throw new InvalidArgumentError("Must be a positive integer.");
+  }
+  return jobs;
+}
 
 const program = new Command();
 
 program
   .name("solo-dev-skills")
   .description("CLI tool to initialize solo-dev-skills in your project")
-  .version("1.0.0");
+  .version(VERSION);
 
 program
   .command("init")
@@ -17,7 +39,27 @@ program
     "Specify environment (cursor|claude|both)",
     "both"
   )
-  .action(init);
+  .option("--sync", "Only copy files that were added or changed upstream")
+  .option("--prune", "Delete files removed upstream (implies --sync)")
+  .option(
+    "-j, --jobs <n>",
+    "Max concurrent copy jobs (default: CPU count)",
+    parseJobs
+  )
+  .option(
+    "--link-mode <mode>",
+    "How to fill additional targets (copy|hardlink|symlink|reflink)",
+    "copy"
+  )
+  .option("--dry-run", "Show what would be written without touching disk")
+  .option("--json", "Print the --dry-run plan as JSON")
+  .option(
+    "--projects <glob|file>",
+    "Install into every project directory matched by a glob or listed in a file"
+  )
+  .option("--profile", "Print a per-phase and per-skill timing breakdown")
+  .option("--trace <file>", "Write a Chrome trace-event file")
+  .action(lazy("../src/commands/init.js", "init"));
 
 program
   .command("add <skills...>")
@@ -27,8 +69,33 @@ program
     "Specify environment (cursor|claude|both)",
     "both"
   )
-  .action(add);
+  .option("--sync", "Only copy files that were added or changed upstream")
+  .option("--prune", "Delete files removed upstream (implies --sync)")
+  .option(
+    "-j, --jobs <n>",
+    "Max concurrent copy jobs (default: CPU count)",
+    parseJobs
+  )
+  .option(
+    "--link-mode <mode>",
+    "How to fill additional targets (copy|hardlink|symlink|reflink)",
+    "copy"
+  )
+  .option("--dry-run", "Show what would be written without touching disk")
+  .option("--json", "Print the --dry-run plan as JSON")
+  .option(
+    "--projects <glob|file>",
+    "Install into every project directory matched by a glob or listed in a file"
+  )
+  .option("--profile", "Print a per-phase and per-skill timing breakdown")
+  .option("--trace <file>", "Write a Chrome trace-event file")
+  .action(lazy("../src/commands/init.js", "add"));
 
-program.command("list").description("List all available skills").action(list);
+program
+  .command("list")
+  .description("List all available skills")
+  .option("--json", "Print the skill catalog as JSON")
+  .option("-l, --long", "Show file count, size and description")
+  .action(lazy("../src/commands/list.js", "list"));
 
-program.parse();
+await program.parseAsync();
@@ -0,0 +1,14 @@
+#!/usr/bin/env node
+import { fileURLToPath } from "url";
+import { dirname, join } from "path";
+import fs from "fs/promises";
+import { buildCatalog } from "../src/lib/catalog.js";
+
+const root = join(dirname(fileURLToPath(import.meta.url)), "..");
+const catalog = await buildCatalog(join(root, ".claude/skills"));
+
+await fs.writeFile(
+  join(root, "skills-catalog.json"),
+  JSON.stringify(catalog)
+);
+console.log(`✓ Wrote skills-catalog.json (${catalog.skills.length} skills)`);
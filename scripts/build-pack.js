@@ -0,0 +1,18 @@
+#!/usr/bin/env node
+import { fileURLToPath } from "url";
+import { dirname, join } from "path";
+import { buildCatalog } from "../src/lib/catalog.js";
+import { writePack } from "../src/lib/pack.js";
+
+const root = join(dirname(fileURLToPath(import.meta.url)), "..");
+const sourceDir = join(root, ".claude/skills");
+const catalog = await buildCatalog(sourceDir);
+const { files, bytes } = await writePack(
+  join(root, "skills.pack"),
+  sourceDir,
+  catalog
+);
+
+console.log(
+  `✓ Wrote skills.pack (${catalog.skills.length} skills, ${files} files, ${bytes} bytes)`
+);
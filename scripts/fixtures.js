@@ -0,0 +1,53 @@
+import { join } from "path";
+import fs from "fs/promises";
+import { buildCatalog } from "../src/lib/catalog.js";
+import { writePack } from "../src/lib/pack.js";
+
+// Synthetic skill trees shared by the benchmarks and the test suite.
+
+// Named tree shapes for the copy benchmark.
+export const SHAPES = {
+  large: { skills: 4, files: 4, bytes: 4 * 1024 * 1024, depth: 1 },
+  tiny: { skills: 20, files: 200, bytes: 200, depth: 1 },
+  deep: { skills: 10, files: 60, bytes: 2048, depth: 12 },
+};
+
+// Writes `skills` synthetic skills of `files` files each (`bytes` per file,
+// spread over `depth` levels of nested directories) under root/.claude/skills,
+// plus a catalog next to it, so root can be used as SOLO_DEV_SKILLS_HOME.
+// With `pack`, the tree is packed into skills.pack and then removed, the way
+// the published package looks.
+export async function createSkillHome(
+  root,
+  { skills, files, bytes, depth = 1, pack = false }
+) {
+  const source = join(root, ".claude/skills");
+  const body = "x".repeat(bytes);
+
+  for (let s = 0; s < skills; s++) {
+    const name = `skill-${s}`;
+    await fs.mkdir(join(source, name), { recursive: true });
+    await fs.writeFile(
+      join(source, name, "SKILL.md"),
+      `---\nname: ${name}\ndescription: Synthetic skill ${s}\n---\n${body}`
+    );
+    for (let f = 1; f < files; f++) {
+      const levels = Array.from({ length: f % depth }, (_, l) => `level-${l}`);
+      const dir = join(source, name, "references", ...levels);
+      await fs.mkdir(dir, { recursive: true });
+      await fs.writeFile(join(dir, `ref-${f}.md`), `${f}\n${body}`);
+    }
+  }
+
+  const catalog = await buildCatalog(source);
+  if (pack) {
+    await writePack(join(root, "skills.pack"), source, catalog);
+    await fs.rm(join(root, ".claude"), { recursive: true });
+  } else {
+    await fs.writeFile(
+      join(root, "skills-catalog.json"),
+      JSON.stringify(catalog)
+    );
+  }
+  return { root, catalog };
+}
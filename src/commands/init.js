@@ -1,21 +1,24 @@
-import { fileURLToPath } from "url";
-import { dirname, join } from "path";
-import fs from "fs-extra";
-
-const __filename = fileURLToPath(import.meta.url);
-const __dirname = dirname(__filename);
-const SKILLS_SOURCE = join(__dirname, "../../.claude/skills");
+import { join, relative } from "path";
+import fs from "fs/promises";
+import { formatBytes } from "../lib/format.js";
+import { LINK_MODES } from "../lib/link.js";
+import { defaultJobs, runPool } from "../lib/pool.js";
+import { resolveProjects } from "../lib/projects.js";
+import { createProfiler, printProfile, writeTrace } from "../lib/profiler.js";
+import { cacheSource, getCatalog, getSource } from "../lib/skills.js";
+import {
+  applyPlan,
+  planSkill,
+  readManifest,
+  removedSkills,
+  writeManifest,
+} from "../lib/sync.js";
 
 const TARGETS = {
   cursor: ".cursor/skills",
   claude: ".claude/skills",
 };
 
-async function getAvailableSkills() {
-  const items = await fs.readdir(SKILLS_SOURCE);
-  return items.filter((s) => !s.startsWith("."));
-}
-
 function getTargetPaths(environment) {
   if (!["cursor", "claude", "both"].includes(environment)) {
     console.error(
@@ -28,46 +31,428 @@ function getTargetPaths(environment) {
     : [TARGETS[environment]];
 }
 
-async function copySkills(skillNames, targets) {
-  const cwd = process.cwd();
-  const available = await getAvailableSkills();
+const ACTIONS = ["create", "update", "unchanged", "delete"];
+
+function emptyTotals() {
+  return { copied: 0, linked: 0, skipped: 0, deleted: 0 };
+}
+
+// Installs skills (catalog entries) into the targets under one project
+// root. Failures are returned per skill and target rather than thrown, so a
+// batch run can carry on with the other projects.
+async function installSkills(cwd, skills, targets, source, settings) {
+  const { sync, prune, linkMode, limit, dryRun, verbose, profiler } =
+    settings;
+  const totals = emptyTotals();
+  const removed = (i) =>
+    settings.pruneRemoved ? removedSkills(manifests[i], settings.catalog) : [];
+
+  const manifests = await Promise.all(
+    targets.map((target) =>
+      profiler.span("manifest", `read ${target}/manifest`, () =>
+        readManifest(join(cwd, target))
+      )
+    )
+  );
+
+  // Outside copy mode the first target is written from the source and the
+  // remaining targets are linked to it. Reflinks may silently turn into
+  // full copies, so only hard and symbolic links count as writing nothing.
+  const linking = linkMode !== "copy" && targets.length > 1;
+
+  if (dryRun) {
+    const noWrites = linking && linkMode !== "reflink";
+    const pairs = targets.flatMap((target, i) =>
+      [...skills, ...removed(i)].map((skill) => ({
+        skill,
+        target,
+        manifest: manifests[i],
+        linked: noWrites && i > 0,
+      }))
+    );
+    const results = await runPool(
+      pairs.map(({ skill, target, manifest, linked }) => () =>
+        profiler.span(
+          "plan",
+          `${skill.name} → ${target}`,
+          () =>
+            planSkill(join(cwd, target), skill, manifest, {
+              sync,
+              prune,
+              linked,
+            }),
+          (plan) => ({ skill: skill.name, target, bytes: plan.bytes })
+        )
+      ),
+      limit
+    );
+    return {
+      totals,
+      plans: pairs.map(({ target }, i) => ({ target, ...results[i].value })),
+      failures: collectFailures(pairs, results),
+    };
+  }
+
+  await Promise.all(
+    targets.map((target) =>
+      profiler.span("ensureDir", target, () =>
+        fs.mkdir(join(cwd, target), { recursive: true })
+      )
+    )
+  );
+
+  const copySkill = async (skill, target, manifest, linkFrom) => {
+    const targetPath = join(cwd, target);
+    const plan = await planSkill(targetPath, skill, manifest, {
+      sync,
+      prune,
+    });
+    const stats = await applyPlan(source, targetPath, plan, manifest, {
+      linkFrom,
+      linkMode,
+    });
+    return { ...stats, bytes: plan.bytes };
+  };
+
+  const runJobs = (jobs) =>
+    runPool(
+      jobs.map(({ skill, target, manifest, linkFrom }) => async () => {
+        const stats = await profiler.span(
+          "copy",
+          `${skill.name} → ${target}`,
+          () => copySkill(skill, target, manifest, linkFrom),
+          (result) => ({
+            skill: skill.name,
+            target,
+            files: result.copied + result.linked,
+            bytes: result.bytes,
+          })
+        );
+        for (const key of Object.keys(totals)) totals[key] += stats[key];
+        if (!verbose) return;
+        const verb =
+          Object.keys(skill.entries).length === 0
+            ? "Removed"
+            : stats.copied > 0 || stats.deleted > 0
+              ? "Copied"
+              : stats.linked > 0
+                ? "Linked"
+                : "Up to date";
+        console.log(`✓ ${verb} ${skill.name} → ${target}/${skill.name}`);
+      }),
+      limit
+    );
+
+  // Linked targets run as a second phase, once the primary copy exists.
+  const primaryTargets = linking ? targets.slice(0, 1) : targets;
+
+  const jobs = [];
+  primaryTargets.forEach((target, i) => {
+    for (const skill of skills) {
+      jobs.push({ skill, target, manifest: manifests[i] });
+    }
+  });
+  const results = await runJobs(jobs);
+
+  if (linking) {
+    // A skill whose primary copy failed has nothing to link to; write the
+    // remaining targets straight from the source instead.
+    const linkJobs = [];
+    targets.slice(1).forEach((target, i) => {
+      skills.forEach((skill, j) => {
+        linkJobs.push({
+          skill,
+          target,
+          manifest: manifests[i + 1],
+          linkFrom:
+            results[j].status === "fulfilled"
+              ? join(cwd, targets[0], skill.name)
+              : undefined,
+        });
+      });
+    });
+    jobs.push(...linkJobs);
+    results.push(...(await runJobs(linkJobs)));
+  }
+
+  // `init --prune` also removes skills that disappeared upstream entirely.
+  const removeJobs = targets.flatMap((target, i) =>
+    removed(i).map((skill) => ({ skill, target, manifest: manifests[i] }))
+  );
+  jobs.push(...removeJobs);
+  results.push(...(await runJobs(removeJobs)));
+
+  await Promise.all(
+    targets.map((target, i) =>
+      profiler.span("manifest", `write ${target}/manifest`, () =>
+        writeManifest(join(cwd, target), manifests[i])
+      )
+    )
+  );
+
+  return { totals, failures: collectFailures(jobs, results) };
+}
+
+function collectFailures(jobs, results) {
+  return results
+    .map((result, i) => ({ ...jobs[i], result }))
+    .filter(({ result }) => result.status === "rejected")
+    .map(({ skill, target, result }) => ({
+      skill: skill.name,
+      target,
+      error: result.reason,
+    }));
+}
+
+function printFailures(failures, indent = "  ") {
+  for (const { skill, target, error } of failures) {
+    console.error(
+      `${indent}- ${skill} → ${target}/${skill}: ${error.message}`
+    );
+  }
+}
+
+function formatTotals(totals) {
+  return `${totals.copied} copied, ${totals.linked} linked, ${totals.skipped} skipped, ${totals.deleted} deleted`;
+}
+
+function summarizePlan(plans) {
+  const rows = plans.map(({ target, skill, files, bytes, linked }) => {
+    const row = { target, skill: skill.name, linked, bytes };
+    for (const action of ACTIONS) {
+      row[action] = files.filter((f) => f.action === action).length;
+    }
+    row.changes = files.filter((f) => f.action !== "unchanged");
+    return row;
+  });
+
+  const totals = { bytes: 0 };
+  for (const action of ACTIONS) totals[action] = 0;
+  for (const row of rows) {
+    for (const key of Object.keys(totals)) totals[key] += row[key];
+  }
+  return { plan: rows, totals };
+}
+
+function printPlanTable({ plan, totals }) {
+  const header = ["Target", "Skill", "Create", "Update", "Unchanged", "Delete"];
+  const table = plan.map((row) => [
+    row.linked ? `${row.target} (linked)` : row.target,
+    row.skill,
+    ...ACTIONS.map((action) => String(row[action])),
+    formatBytes(row.bytes),
+  ]);
+  table.push([
+    "Total",
+    "",
+    ...ACTIONS.map((action) => String(totals[action])),
+    formatBytes(totals.bytes),
+  ]);
+  const lines = [[...header, "To write"], ...table];
+  const widths = lines[0].map((_, c) =>
+    Math.max(...lines.map((line) => line[c].length))
+  );
+
+  for (const line of lines) {
+    const cells = line.map((cell, c) =>
+      c < 2 ? cell.padEnd(widths[c]) : cell.padStart(widths[c])
+    );
+    console.log(`  ${cells.join("  ")}`);
+  }
+}
 
-  const invalid = skillNames.filter((s) => !available.includes(s));
+// Installs the named skills (all of them when skillNames is null) and exits
+// non-zero if anything failed, after printing any requested profile. Returns
+// the number of distinct skills installed.
+async function copySkills(skillNames, targets, options = {}) {
+  const profiler = createProfiler(Boolean(options.profile || options.trace));
+  const allSkills = skillNames === null;
+  const { catalog, invalid } = await profiler.span(
+    "validation",
+    "validate skills",
+    async () => {
+      const catalog = await getCatalog();
+      skillNames = [...new Set(skillNames ?? catalog.keys())];
+      return { catalog, invalid: skillNames.filter((s) => !catalog.has(s)) };
+    }
+  );
   if (invalid.length > 0) {
     console.error(`Unknown skills: ${invalid.join(", ")}`);
     console.error(`Run 'solo-dev-skills list' to see available skills.`);
     process.exit(1);
   }
 
-  for (const target of targets) {
-    const targetPath = join(cwd, target);
-    await fs.ensureDir(targetPath);
+  const linkMode = options.linkMode ?? "copy";
+  if (!LINK_MODES.includes(linkMode)) {
+    console.error(
+      `Invalid link mode: ${linkMode}. Use ${LINK_MODES.join(", ")}.`
+    );
+    process.exit(1);
+  }
+
+  const skills = skillNames.map((name) => catalog.get(name));
+  const settings = {
+    sync: Boolean(options.sync || options.prune),
+    prune: Boolean(options.prune),
+    linkMode,
+    limit: options.jobs ?? defaultJobs(),
+    dryRun: Boolean(options.dryRun),
+    pruneRemoved: Boolean(options.prune) && allSkills,
+    catalog,
+    profiler,
+  };
+
+  const failed = options.projects
+    ? await copyToProjects(options.projects, skills, targets, settings, options)
+    : await copyToCwd(skills, targets, settings, options);
+
+  if (options.profile) printProfile(profiler);
+  if (options.trace) {
+    await writeTrace(profiler, options.trace);
+    console.log(`\n✓ Wrote trace to ${options.trace}`);
+  }
+  if (failed) process.exit(1);
+  return skills.length;
+}
+
+async function copyToCwd(skills, targets, settings, options) {
+  const source = await getSource();
+  const { totals, plans, failures } = await installSkills(
+    process.cwd(),
+    skills,
+    targets,
+    source,
+    { ...settings, verbose: true }
+  );
 
-    for (const skill of skillNames) {
-      const src = join(SKILLS_SOURCE, skill);
-      const dest = join(targetPath, skill);
-      await fs.copy(src, dest, { overwrite: true });
-      console.log(`✓ Copied ${skill} → ${target}/${skill}`);
+  if (settings.dryRun && failures.length === 0) {
+    const summary = summarizePlan(plans);
+    if (options.json) {
+      console.log(JSON.stringify(summary, null, 2));
+    } else {
+      console.log("Dry run — nothing was written:\n");
+      printPlanTable(summary);
     }
+  } else if (!settings.dryRun) {
+    console.log(`\nFiles: ${formatTotals(totals)}`);
+  }
+
+  if (failures.length > 0) {
+    console.error(`\n✗ ${failures.length} copy job(s) failed:`);
+    printFailures(failures);
   }
+  return failures.length > 0;
+}
+
+// Installs into every project matched by `spec`, reading the source skill
+// tree into memory once and running up to `limit` projects at a time.
+async function copyToProjects(spec, skills, targets, settings, options) {
+  const started = performance.now();
+  const projects = await resolveProjects(spec);
+  if (projects.length === 0) {
+    console.error(`No project directories match ${spec}`);
+    process.exit(1);
+  }
+
+  const { limit, profiler } = settings;
+  const sourceStarted = performance.now();
+  let source;
+  try {
+    source = await profiler.span("source", "cache skills", async () =>
+      cacheSource(await getSource(), skills, limit)
+    );
+  } catch (err) {
+    console.error(`✗ Could not read skills: ${err.message}`);
+    return true;
+  }
+  const sourceMs = performance.now() - sourceStarted;
+
+  const perProject = {
+    ...settings,
+    limit: Math.max(1, Math.floor(limit / projects.length)),
+    verbose: false,
+  };
+  const label = (project) => relative(process.cwd(), project) || ".";
+  const totals = emptyTotals();
+  const projectMs = [];
+
+  const results = await runPool(
+    projects.map((project) => async () => {
+      const projectStarted = performance.now();
+      if (!(await fs.stat(project).catch(() => null))?.isDirectory()) {
+        throw new Error("not a directory");
+      }
+      const result = await profiler.span("project", label(project), () =>
+        installSkills(project, skills, targets, source, perProject)
+      );
+      const ms = Math.round(performance.now() - projectStarted);
+      projectMs.push(ms);
+      for (const key of Object.keys(totals)) totals[key] += result.totals[key];
+
+      if (result.failures.length > 0) {
+        console.error(
+          `✗ ${label(project)}: ${result.failures.length} copy job(s) failed (${ms} ms)`
+        );
+        printFailures(result.failures, "    ");
+      } else if (!settings.dryRun) {
+        console.log(
+          `✓ ${label(project)}: ${formatTotals(result.totals)} (${ms} ms)`
+        );
+      }
+      return result;
+    }),
+    limit
+  );
+
+  let failed = 0;
+  const plans = [];
+  results.forEach((result, i) => {
+    const project = label(projects[i]);
+    if (result.status === "rejected") {
+      console.error(`✗ ${project}: ${result.reason.message}`);
+      failed++;
+    } else if (result.value.failures.length > 0) {
+      failed++;
+    } else if (settings.dryRun) {
+      plans.push({ project, ...summarizePlan(result.value.plans) });
+    }
+  });
+
+  if (settings.dryRun) {
+    if (options.json) {
+      console.log(JSON.stringify({ projects: plans }, null, 2));
+    } else {
+      for (const { project, ...summary } of plans) {
+        console.log(`\n${project} (dry run):\n`);
+        printPlanTable(summary);
+      }
+    }
+  }
+
+  const totalMs = Math.round(performance.now() - started);
+  const meanMs = projectMs.reduce((sum, ms) => sum + ms, 0) / projectMs.length;
+  console.log(
+    `\nProjects: ${projects.length - failed} succeeded, ${failed} failed`
+  );
+  if (!settings.dryRun) console.log(`Files: ${formatTotals(totals)}`);
+  console.log(
+    `Time: ${totalMs} ms total, ${Math.round(sourceMs)} ms reading skills, ` +
+      `${Math.round(meanMs || 0)} ms per project (mean)`
+  );
+
+  return failed > 0;
 }
 
 export async function init(options) {
   const targets = getTargetPaths(options.environment);
-  const skills = await getAvailableSkills();
-  await copySkills(skills, targets);
+  await copySkills(null, targets, options);
+  if (options.dryRun) return;
   console.log(`\n✓ All skills initialized for ${options.environment}`);
 }
 
 export async function add(skills, options) {
   const targets = getTargetPaths(options.environment);
-  await copySkills(skills, targets);
-  console.log(`\n✓ Added ${skills.length} skill(s) for ${options.environment}`);
-}
-
-export async function list() {
-  const skills = await getAvailableSkills();
-  console.log("Available skills:\n");
-  skills.forEach((s) => console.log(`  - ${s}`));
-  console.log(`\nTotal: ${skills.length} skills`);
+  const count = await copySkills(skills, targets, options);
+  if (options.dryRun) return;
+  console.log(`\n✓ Added ${count} skill(s) for ${options.environment}`);
 }
@@ -0,0 +1,30 @@
+import { formatBytes } from "../lib/format.js";
+import { getCatalog, getSkillNames } from "../lib/skills.js";
+
+export async function list(options = {}) {
+  if (!options.json && !options.long) {
+    const names = await getSkillNames();
+    console.log("Available skills:\n");
+    names.forEach((name) => console.log(`  - ${name}`));
+    console.log(`\nTotal: ${names.length} skills`);
+    return;
+  }
+
+  const skills = [...(await getCatalog()).values()];
+
+  if (options.json) {
+    const summary = skills.map(({ entries, ...skill }) => skill);
+    console.log(JSON.stringify(summary, null, 2));
+    return;
+  }
+
+  console.log("Available skills:\n");
+  const width = Math.max(...skills.map((s) => s.name.length));
+  skills.forEach((s) => {
+    const files = `${s.files} files`.padStart(10);
+    const size = formatBytes(s.bytes).padStart(9);
+    const name = s.name.padEnd(width);
+    console.log(`  ${name} ${files} ${size}  ${s.description}`);
+  });
+  console.log(`\nTotal: ${skills.length} skills`);
+}
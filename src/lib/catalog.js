@@ -0,0 +1,119 @@
+import { createHash } from "crypto";
+import { join } from "path";
+import fs from "fs/promises";
+import { hashFile, walkFiles } from "./sync.js";
+
+export const CATALOG_VERSION = 1;
+
+function parseDescription(markdown) {
+  const match = markdown.match(/^---\r?\n([\s\S]*?)\r?\n---/);
+  if (!match) return "";
+
+  const lines = match[1].split(/\r?\n/);
+  const start = lines.findIndex((line) => /^description\s*:/.test(line));
+  if (start === -1) return "";
+
+  let value = lines[start].replace(/^description\s*:\s*/, "").trim();
+  if (value === "" || /^[>|][-+]?$/.test(value)) {
+    const block = [];
+    for (const line of lines.slice(start + 1)) {
+      if (!/^\s+\S/.test(line)) break;
+      block.push(line.trim());
+    }
+    value = block.join(" ");
+  }
+  return value.replace(/^(["'])([\s\S]*)\1$/, "$2");
+}
+
+async function buildSkillEntry(sourceDir, name) {
+  const skillDir = join(sourceDir, name);
+  const entries = {};
+  let bytes = 0;
+
+  for (const file of await walkFiles(skillDir)) {
+    const path = join(skillDir, file);
+    const { size } = await fs.stat(path);
+    entries[file] = { size, hash: await hashFile(path) };
+    bytes += size;
+  }
+
+  const hash = createHash("sha256");
+  for (const [file, entry] of Object.entries(entries)) {
+    hash.update(`${file}\0${entry.hash}\n`);
+  }
+
+  const skillMd = entries["SKILL.md"]
+    ? await fs.readFile(join(skillDir, "SKILL.md"), "utf8")
+    : "";
+
+  return {
+    name,
+    description: parseDescription(skillMd),
+    files: Object.keys(entries).length,
+    bytes,
+    hash: hash.digest("hex"),
+    entries,
+  };
+}
+
+// Skill names are the directory names under sourceDir, from one readdir.
+export async function listSkillNames(sourceDir) {
+  const items = await fs.readdir(sourceDir, { withFileTypes: true });
+  return items
+    .filter((item) => item.isDirectory() && !item.name.startsWith("."))
+    .map((item) => item.name)
+    .sort();
+}
+
+// Scans every skill directory under sourceDir. This is what the publish
+// step writes to disk; at runtime it only runs when no up-to-date catalog
+// is present (i.e. in a development checkout).
+export async function buildCatalog(sourceDir) {
+  const names = await listSkillNames(sourceDir);
+
+  return {
+    version: CATALOG_VERSION,
+    skills: await Promise.all(
+      names.map((name) => buildSkillEntry(sourceDir, name))
+    ),
+  };
+}
+
+// Latest mtime of any file or directory under dir. Directory mtimes catch
+// files that were added or removed; file mtimes catch edits.
+export async function newestMtime(dir) {
+  let newest = (await fs.stat(dir)).mtimeMs;
+  const entries = await fs.readdir(dir, { withFileTypes: true });
+  for (const entry of entries) {
+    const path = join(dir, entry.name);
+    const mtime = entry.isDirectory()
+      ? await newestMtime(path)
+      : (await fs.stat(path)).mtimeMs;
+    newest = Math.max(newest, mtime);
+  }
+  return newest;
+}
+
+// Uses the catalog at catalogPath only if it is newer than everything in
+// sourceDir; a leftover catalog from an earlier build would otherwise hide
+// edits to the skill tree. Checking costs one stat per file, which is still
+// far cheaper than rehashing. The catalog is only a cache, so a missing or
+// unparsable one is rebuilt.
+export async function loadCatalog(catalogPath, sourceDir) {
+  try {
+    const [text, { mtimeMs }] = await Promise.all([
+      fs.readFile(catalogPath, "utf8"),
+      fs.stat(catalogPath),
+    ]);
+    const catalog = JSON.parse(text);
+    if (
+      catalog.version === CATALOG_VERSION &&
+      mtimeMs >= (await newestMtime(sourceDir))
+    ) {
+      return catalog;
+    }
+  } catch (err) {
+    if (err.code !== "ENOENT" && !(err instanceof SyntaxError)) throw err;
+  }
+  return buildCatalog(sourceDir);
+}
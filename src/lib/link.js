@@ -0,0 +1,44 @@
+import { dirname, relative } from "path";
+import fs from "fs/promises";
+
+export const LINK_MODES = ["copy", "hardlink", "symlink", "reflink"];
+
+// Errors meaning "links are not possible here" (different device, filesystem
+// without link or clone support, link count exhausted) rather than a real
+// failure.
+const FALLBACK_CODES = new Set([
+  "EXDEV",
+  "EPERM",
+  "ENOTSUP",
+  "ENOSYS",
+  "EMLINK",
+]);
+
+// Places `src` at `dest` using the given link mode and returns "copied" or
+// "linked" depending on what actually happened. Hardlinks, symlinks and
+// reflinks (COPYFILE_FICLONE_FORCE) fall back to a plain copy, reported as
+// "copied", when the filesystem refuses them. Any existing file is unlinked
+// first so a previous hardlink or symlink never gets written through.
+export async function placeFile(src, dest, mode = "copy") {
+  await fs.rm(dest, { force: true });
+  if (mode === "copy") {
+    await fs.copyFile(src, dest);
+    return "copied";
+  }
+
+  try {
+    if (mode === "reflink") {
+      await fs.copyFile(src, dest, fs.constants.COPYFILE_FICLONE_FORCE);
+    } else if (mode === "hardlink") {
+      await fs.link(src, dest);
+    } else {
+      await fs.symlink(relative(dirname(dest), src), dest);
+    }
+    return "linked";
+  } catch (err) {
+    if (!FALLBACK_CODES.has(err.code)) throw err;
+    await fs.rm(dest, { force: true });
+    await fs.copyFile(src, dest);
+    return "copied";
+  }
+}
@@ -0,0 +1,94 @@
+import fs from "fs/promises";
+import { join } from "path";
+
+// Layout: 8-byte magic, uint32 BE index length, JSON index, then the file
+// contents back to back. The index is a catalog whose per-file entries also
+// carry `offset` (relative to the data section) and `mode`.
+const MAGIC = Buffer.from("SDSKPK01");
+const HEADER_SIZE = MAGIC.length + 4;
+const CHUNK_SIZE = 1024 * 1024;
+
+export async function writePack(packPath, sourceDir, catalog) {
+  let offset = 0;
+  let files = 0;
+  for (const skill of catalog.skills) {
+    for (const [file, entry] of Object.entries(skill.entries)) {
+      const { mode } = await fs.stat(join(sourceDir, skill.name, file));
+      entry.offset = offset;
+      entry.mode = mode & 0o777;
+      offset += entry.size;
+      files++;
+    }
+  }
+
+  const index = Buffer.from(JSON.stringify(catalog));
+  const header = Buffer.alloc(HEADER_SIZE);
+  MAGIC.copy(header);
+  header.writeUInt32BE(index.length, MAGIC.length);
+
+  const out = await fs.open(packPath, "w");
+  try {
+    await out.write(header);
+    await out.write(index);
+    for (const skill of catalog.skills) {
+      for (const file of Object.keys(skill.entries)) {
+        await out.write(await fs.readFile(join(sourceDir, skill.name, file)));
+      }
+    }
+  } finally {
+    await out.close();
+  }
+  return { files, bytes: HEADER_SIZE + index.length + offset };
+}
+
+async function readExactly(handle, length, position) {
+  const buffer = Buffer.allocUnsafe(length);
+  const { bytesRead } = await handle.read(buffer, 0, length, position);
+  if (bytesRead !== length) throw new Error("Truncated skill pack");
+  return buffer;
+}
+
+// Opens a pack and reads only its header and index, using positioned reads.
+// Returns null when the pack does not exist.
+export async function openPack(packPath) {
+  let handle;
+  try {
+    handle = await fs.open(packPath, "r");
+  } catch (err) {
+    if (err.code === "ENOENT") return null;
+    throw err;
+  }
+
+  const header = await readExactly(handle, HEADER_SIZE, 0);
+  if (!header.subarray(0, MAGIC.length).equals(MAGIC)) {
+    await handle.close();
+    throw new Error(`${packPath} is not a skill pack`);
+  }
+  const indexLength = header.readUInt32BE(MAGIC.length);
+  const index = JSON.parse(await readExactly(handle, indexLength, HEADER_SIZE));
+  const dataStart = HEADER_SIZE + indexLength;
+
+  // Streams one file's byte range out of the pack in bounded chunks.
+  const extract = async (entry, dest) => {
+    await fs.rm(dest, { force: true });
+    const out = await fs.open(dest, "w", entry.mode);
+    try {
+      const chunk = Buffer.allocUnsafe(Math.min(entry.size, CHUNK_SIZE));
+      for (let done = 0; done < entry.size; ) {
+        const length = Math.min(CHUNK_SIZE, entry.size - done);
+        const position = dataStart + entry.offset + done;
+        const { bytesRead } = await handle.read(chunk, 0, length, position);
+        if (bytesRead === 0) throw new Error("Truncated skill pack");
+        await out.write(chunk, 0, bytesRead);
+        done += bytesRead;
+      }
+    } finally {
+      await out.close();
+    }
+  };
+
+  const read = (entry) =>
+    readExactly(handle, entry.size, dataStart + entry.offset);
+
+  return { catalog: index, extract, read, close: () => handle.close() };
+}
@@ -0,0 +1,30 @@
+import os from "os";
+
+export function defaultJobs() {
+  return typeof os.availableParallelism === "function"
+    ? os.availableParallelism()
+    : os.cpus().length || 1;
+}
+
+// Runs task functions with at most `limit` in flight. Like
+// Promise.allSettled, every task runs to completion and the results come
+// back in task order, so one failure never cancels the rest.
+export async function runPool(tasks, limit = defaultJobs()) {
+  const results = new Array(tasks.length);
+  let next = 0;
+
+  const worker = async () => {
+    while (next < tasks.length) {
+      const index = next++;
+      try {
+        results[index] = { status: "fulfilled", value: await tasks[index]() };
+      } catch (reason) {
+        results[index] = { status: "rejected", reason };
+      }
+    }
+  };
+
+  const workers = Math.max(1, Math.min(limit, tasks.length));
+  await Promise.all(Array.from({ length: workers }, worker));
+  return results;
+}
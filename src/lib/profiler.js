@@ -0,0 +1,136 @@
+import fs from "fs/promises";
+import { formatBytes } from "./format.js";
+
+// The disabled profiler just calls through, so instrumented code pays only
+// for the wrapping closure.
+const NOOP = {
+  enabled: false,
+  span: (category, name, fn) => fn(),
+};
+
+export function createProfiler(enabled) {
+  if (!enabled) return NOOP;
+
+  const origin = performance.now();
+  const events = [];
+  const lanes = [];
+
+  // Each span runs on the lowest free lane (trace "thread") so concurrent
+  // jobs show up side by side rather than overlapping.
+  const span = async (category, name, fn, describe) => {
+    let lane = lanes.indexOf(false);
+    if (lane === -1) lane = lanes.length;
+    lanes[lane] = true;
+    const start = performance.now();
+    let result;
+    let ok = false;
+    try {
+      result = await fn();
+      ok = true;
+      return result;
+    } finally {
+      const end = performance.now();
+      lanes[lane] = false;
+      events.push({
+        category,
+        name,
+        lane,
+        start: start - origin,
+        duration: end - start,
+        args: ok && describe ? describe(result) : {},
+      });
+    }
+  };
+
+  return { enabled: true, span, events };
+}
+
+function pad(rows) {
+  const widths = rows[0].map((_, c) =>
+    Math.max(...rows.map((row) => String(row[c]).length))
+  );
+  for (const row of rows) {
+    const cells = row.map((cell, c) =>
+      c === 0
+        ? String(cell).padEnd(widths[c])
+        : String(cell).padStart(widths[c])
+    );
+    console.log(`  ${cells.join("  ")}`);
+  }
+}
+
+export function printProfile(profiler) {
+  const phases = new Map();
+  const skills = new Map();
+
+  for (const event of profiler.events) {
+    const phase = phases.get(event.category) ?? {
+      count: 0,
+      total: 0,
+      first: Infinity,
+      last: 0,
+    };
+    phase.count++;
+    phase.total += event.duration;
+    phase.first = Math.min(phase.first, event.start);
+    phase.last = Math.max(phase.last, event.start + event.duration);
+    phases.set(event.category, phase);
+
+    if (event.category === "copy" && event.args.skill) {
+      const skill = skills.get(event.args.skill) ?? {
+        files: 0,
+        bytes: 0,
+        ms: 0,
+      };
+      skill.files += event.args.files;
+      skill.bytes += event.args.bytes;
+      skill.ms += event.duration;
+      skills.set(event.args.skill, skill);
+    }
+  }
+
+  console.log("\nProfile by phase:\n");
+  pad([
+    ["Phase", "Count", "Total ms", "Wall ms"],
+    ...[...phases].map(([name, p]) => [
+      name,
+      p.count,
+      p.total.toFixed(1),
+      (p.last - p.first).toFixed(1),
+    ]),
+  ]);
+
+  if (skills.size > 0) {
+    console.log("\nProfile by skill (all targets):\n");
+    pad([
+      ["Skill", "Files", "Bytes", "ms"],
+      ...[...skills]
+        .sort(([, a], [, b]) => b.ms - a.ms)
+        .map(([name, s]) => [
+          name,
+          s.files,
+          formatBytes(s.bytes),
+          s.ms.toFixed(1),
+        ]),
+    ]);
+  }
+}
+
+// Writes the recorded spans in Chrome trace-event format (load it in
+// chrome://tracing or https://ui.perfetto.dev).
+export async function writeTrace(profiler, path) {
+  const traceEvents = profiler.events.map((event) => ({
+    name: event.name,
+    cat: event.category,
+    ph: "X",
+    ts: Math.round(event.start * 1000),
+    dur: Math.round(event.duration * 1000),
+    pid: process.pid,
+    tid: event.lane,
+    args: event.args,
+  }));
+  await fs.writeFile(
+    path,
+    JSON.stringify({ traceEvents, displayTimeUnit: "ms" })
+  );
+}
@@ -0,0 +1,116 @@
+import { join, parse, resolve } from "path";
+import fs from "fs/promises";
+
+const GLOB_CHARS = /[*?{[]/;
+
+function segmentToRegExp(segment) {
+  let pattern = "";
+  for (let i = 0; i < segment.length; i++) {
+    const char = segment[i];
+    if (char === "*") {
+      pattern += "[^/]*";
+    } else if (char === "?") {
+      pattern += "[^/]";
+    } else if (char === "{") {
+      const end = segment.indexOf("}", i);
+      if (end === -1) {
+        pattern += "\\{";
+        continue;
+      }
+      const options = segment.slice(i + 1, end).split(",");
+      pattern += `(?:${options.map(segmentToRegExp).join("|")})`;
+      i = end;
+    } else if (char === "[") {
+      const end = segment.indexOf("]", i);
+      if (end === -1) {
+        pattern += "\\[";
+        continue;
+      }
+      pattern += segment.slice(i, end + 1).replace(/^\[!/, "[^");
+      i = end;
+    } else {
+      pattern += char.replace(/[.+^$()|\\]/g, "\\$&");
+    }
+  }
+  return pattern;
+}
+
+async function subdirectories(dir) {
+  try {
+    const entries = await fs.readdir(dir, { withFileTypes: true });
+    return entries.filter((e) => e.isDirectory()).map((e) => e.name);
+  } catch (err) {
+    if (err.code === "ENOENT" || err.code === "ENOTDIR") return [];
+    throw err;
+  }
+}
+
+async function isDirectory(path) {
+  try {
+    return (await fs.stat(path)).isDirectory();
+  } catch {
+    return false;
+  }
+}
+
+// Matches directories only. `*`, `?`, `[...]` and `{a,b}` work within one
+// path segment and `**` spans any number of them. As in most shells,
+// wildcards skip dot-directories unless the segment itself starts with a
+// dot, and `**` does not descend into node_modules.
+async function expandGlob(base, segments) {
+  if (segments.length === 0) return [base];
+  const [segment, ...rest] = segments;
+
+  if (segment === "**") {
+    const matches = await expandGlob(base, rest);
+    for (const name of await subdirectories(base)) {
+      if (name.startsWith(".") || name === "node_modules") continue;
+      matches.push(...(await expandGlob(join(base, name), segments)));
+    }
+    return matches;
+  }
+
+  if (!GLOB_CHARS.test(segment)) {
+    const next = join(base, segment);
+    return (await isDirectory(next)) ? expandGlob(next, rest) : [];
+  }
+
+  const regexp = new RegExp(`^${segmentToRegExp(segment)}$`);
+  const matches = [];
+  for (const name of await subdirectories(base)) {
+    if (name.startsWith(".") && !segment.startsWith(".")) continue;
+    if (regexp.test(name)) {
+      matches.push(...(await expandGlob(join(base, name), rest)));
+    }
+  }
+  return matches;
+}
+
+// Resolves `--projects` to a sorted, de-duplicated list of absolute
+// directories. `spec` is either a file listing one project path per line
+// (blank lines and `#` comments ignored) or a glob.
+export async function resolveProjects(spec, cwd = process.cwd()) {
+  const specPath = resolve(cwd, spec);
+  let projects;
+
+  const stat = await fs.stat(specPath).catch(() => null);
+  if (stat?.isFile()) {
+    const lines = (await fs.readFile(specPath, "utf8")).split(/\r?\n/);
+    projects = lines
+      .map((line) => line.trim())
+      .filter((line) => line && !line.startsWith("#"))
+      .map((line) => resolve(cwd, line));
+  } else if (stat?.isDirectory()) {
+    projects = [specPath];
+  } else {
+    const pattern = spec.replace(/\\/g, "/");
+    const { root } = parse(pattern);
+    const segments = pattern
+      .slice(root.length)
+      .split("/")
+      .filter((s) => s && s !== ".");
+    projects = await expandGlob(root || cwd, segments);
+  }
+
+  return [...new Set(projects)].sort();
+}
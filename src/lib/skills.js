@@ -0,0 +1,117 @@
+import { fileURLToPath } from "url";
+import { dirname, join } from "path";
+import fs from "fs/promises";
+import { listSkillNames, loadCatalog } from "./catalog.js";
+import { placeFile } from "./link.js";
+import { openPack } from "./pack.js";
+import { runPool } from "./pool.js";
+
+// SOLO_DEV_SKILLS_HOME points the CLI at another package root (one with
+// skills.pack, or .claude/skills and optionally skills-catalog.json), e.g.
+// for benchmarks.
+const PACKAGE_ROOT =
+  process.env.SOLO_DEV_SKILLS_HOME ??
+  join(dirname(fileURLToPath(import.meta.url)), "../..");
+
+const SKILLS_SOURCE = join(PACKAGE_ROOT, ".claude/skills");
+const PACK_PATH = join(PACKAGE_ROOT, "skills.pack");
+const CATALOG_PATH = join(PACKAGE_ROOT, "skills-catalog.json");
+
+let source;
+let catalog;
+
+async function hasTree() {
+  const tree = await fs.stat(SKILLS_SOURCE).catch(() => null);
+  return Boolean(tree?.isDirectory());
+}
+
+async function openSource() {
+  // A checkout with the loose skill tree always copies from it, so a
+  // skills.pack left behind by `npm pack` never hides local edits. The
+  // published package ships only the pack.
+  const pack = (await hasTree()) ? null : await openPack(PACK_PATH);
+  if (pack) {
+    return {
+      skills: pack.catalog.skills,
+      writeFile: async (skill, file, dest) => {
+        await pack.extract(skill.entries[file], dest);
+        return "copied";
+      },
+      read: async (skill, file) => {
+        const entry = skill.entries[file];
+        return { data: await pack.read(entry), mode: entry.mode };
+      },
+    };
+  }
+
+  const { skills } = await loadCatalog(CATALOG_PATH, SKILLS_SOURCE);
+  return {
+    skills,
+    writeFile: (skill, file, dest) =>
+      placeFile(join(SKILLS_SOURCE, skill.name, file), dest),
+    read: async (skill, file) => {
+      const path = join(SKILLS_SOURCE, skill.name, file);
+      const [data, { mode }] = await Promise.all([
+        fs.readFile(path),
+        fs.stat(path),
+      ]);
+      return { data, mode: mode & 0o777 };
+    },
+  };
+}
+
+// For the pack, its index doubles as the catalog, so reading it touches
+// nothing but the pack header.
+export function getSource() {
+  source ??= openSource();
+  return source;
+}
+
+// Reads every file of the given skills into memory once, at most `limit` at
+// a time so large trees stay under the open-file limit, and returns a source
+// that writes from those buffers, for installing into many projects.
+export async function cacheSource(source, skills, limit) {
+  const cache = new Map();
+  const tasks = skills.flatMap((skill) =>
+    Object.keys(skill.entries).map((file) => async () => {
+      cache.set(`${skill.name}/${file}`, await source.read(skill, file));
+    })
+  );
+  const failures = (await runPool(tasks, limit)).filter(
+    (result) => result.status === "rejected"
+  );
+  if (failures.length > 0) {
+    const { message } = failures[0].reason;
+    throw new Error(
+      failures.length === 1
+        ? message
+        : `${message} (and ${failures.length - 1} more)`
+    );
+  }
+
+  return {
+    skills: source.skills,
+    writeFile: async (skill, file, dest) => {
+      const { data, mode } = cache.get(`${skill.name}/${file}`);
+      await fs.rm(dest, { force: true });
+      await fs.writeFile(dest, data, { mode });
+      return "copied";
+    },
+    read: async (skill, file) => cache.get(`${skill.name}/${file}`),
+  };
+}
+
+export async function getCatalog() {
+  if (!catalog) {
+    const { skills } = await getSource();
+    catalog = new Map(skills.map((skill) => [skill.name, skill]));
+  }
+  return catalog;
+}
+
+// Just the skill names. With the loose tree that is a single readdir, where
+// getCatalog would have to check (or rebuild) the catalog first.
+export async function getSkillNames() {
+  if (await hasTree()) return listSkillNames(SKILLS_SOURCE);
+  return [...(await getCatalog()).keys()];
+}
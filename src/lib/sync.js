@@ -0,0 +1,211 @@
+import { createHash } from "crypto";
+import { dirname, join, relative, sep } from "path";
+import fs from "fs/promises";
+import { placeFile } from "./link.js";
+
+export const MANIFEST_FILE = ".solo-dev-skills.json";
+const MANIFEST_VERSION = 1;
+
+function toKey(path) {
+  return path.split(sep).join("/");
+}
+
+export async function walkFiles(root) {
+  const files = [];
+  const walk = async (dir) => {
+    const entries = await fs.readdir(dir, { withFileTypes: true });
+    for (const entry of entries) {
+      const full = join(dir, entry.name);
+      if (entry.isDirectory()) {
+        await walk(full);
+      } else if (entry.isFile() || entry.isSymbolicLink()) {
+        files.push(toKey(relative(root, full)));
+      }
+    }
+  };
+  await walk(root);
+  return files.sort();
+}
+
+export async function hashFile(path) {
+  const content = await fs.readFile(path);
+  return createHash("sha256").update(content).digest("hex");
+}
+
+export async function readManifest(targetPath) {
+  try {
+    const manifest = JSON.parse(
+      await fs.readFile(join(targetPath, MANIFEST_FILE), "utf8")
+    );
+    if (manifest.version === MANIFEST_VERSION && manifest.files) {
+      return manifest;
+    }
+  } catch {
+    // Missing or unreadable manifest: treat every file as new.
+  }
+  return { version: MANIFEST_VERSION, files: {} };
+}
+
+export async function writeManifest(targetPath, manifest) {
+  const files = {};
+  for (const key of Object.keys(manifest.files).sort()) {
+    files[key] = manifest.files[key];
+  }
+  await fs.writeFile(
+    join(targetPath, MANIFEST_FILE),
+    `${JSON.stringify({ version: MANIFEST_VERSION, files }, null, 2)}\n`
+  );
+}
+
+async function statOrNull(path) {
+  try {
+    return await fs.stat(path);
+  } catch {
+    return null;
+  }
+}
+
+async function existingFiles(dir) {
+  try {
+    return new Set(await walkFiles(dir));
+  } catch (err) {
+    if (err.code === "ENOENT") return new Set();
+    throw err;
+  }
+}
+
+function isUnchanged(entry, hash, destStat) {
+  return (
+    entry !== undefined &&
+    destStat !== null &&
+    entry.hash === hash &&
+    entry.size === destStat.size &&
+    entry.mtime === Math.floor(destStat.mtimeMs)
+  );
+}
+
+async function removeEmptyDirs(dir, stopAt) {
+  while (dir !== stopAt && dir.startsWith(stopAt)) {
+    const entries = await fs.readdir(dir).catch(() => null);
+    if (entries === null || entries.length > 0) return;
+    await fs.rmdir(dir);
+    dir = dirname(dir);
+  }
+}
+
+// Works out what installing one skill (a catalog entry, whose per-file hashes
+// spare us from walking or reading the source) into targetPath would do,
+// without writing anything. The installed copy is read with a single walk;
+// only files the manifest already records with the current hash are stat'ed,
+// to confirm they were not modified since. Every file is marked "create",
+// "update" or "unchanged"; with `prune`, files a previous run installed that
+// no longer exist upstream are marked "delete". Without `sync`, existing
+// files are always rewritten. With `linked`, the target will be filled with
+// links to another target, so its changes add nothing to `bytes`.
+export async function planSkill(targetPath, skill, manifest, options) {
+  const { sync = false, prune = false, linked = false } = options;
+  const destDir = join(targetPath, skill.name);
+  const existing = await existingFiles(destDir);
+  const files = [];
+  let bytes = 0;
+
+  for (const [file, { hash, size }] of Object.entries(skill.entries)) {
+    let action = "create";
+    if (existing.has(file)) {
+      const entry = manifest.files[`${skill.name}/${file}`];
+      const current =
+        sync && entry?.hash === hash
+          ? await statOrNull(join(destDir, file))
+          : null;
+      action = isUnchanged(entry, hash, current) ? "unchanged" : "update";
+    }
+    if (action !== "unchanged" && !linked) bytes += size;
+    files.push({ file, action, size });
+  }
+
+  if (prune) {
+    const prefix = `${skill.name}/`;
+    for (const key of Object.keys(manifest.files)) {
+      const file = key.slice(prefix.length);
+      if (!key.startsWith(prefix) || skill.entries[file]) continue;
+      if (existing.has(file)) files.push({ file, action: "delete", size: 0 });
+    }
+  }
+
+  return { skill, files, bytes, prune, linked };
+}
+
+// Skills that a previous run installed (per the manifest) but that are no
+// longer in the catalog, as empty catalog entries: planning them with
+// `prune` marks every installed file for deletion.
+export function removedSkills(manifest, catalog) {
+  const names = new Set(
+    Object.keys(manifest.files).map((key) => key.split("/")[0])
+  );
+  return [...names]
+    .filter((name) => !catalog.has(name))
+    .map((name) => ({ name, entries: {} }));
+}
+
+// Carries out a plan from planSkill, writing files from `source` (see
+// getSource) and recording them in the manifest. With `linkFrom`, file
+// contents are taken from an already-synced copy of the skill (another
+// target) and placed according to `linkMode` instead.
+export async function applyPlan(source, targetPath, plan, manifest, options) {
+  const { linkFrom, linkMode = "copy" } = options;
+  const { skill } = plan;
+  const stats = { copied: 0, linked: 0, skipped: 0, deleted: 0 };
+  const destDir = join(targetPath, skill.name);
+
+  for (const { file, action } of plan.files) {
+    const key = `${skill.name}/${file}`;
+    const dest = join(destDir, file);
+
+    if (action === "unchanged") {
+      stats.skipped++;
+      continue;
+    }
+
+    if (action === "delete") {
+      await fs.rm(dest, { force: true });
+      await removeEmptyDirs(dirname(dest), destDir);
+      delete manifest.files[key];
+      stats.deleted++;
+      continue;
+    }
+
+    await fs.mkdir(dirname(dest), { recursive: true });
+    const how = linkFrom
+      ? await placeFile(join(linkFrom, file), dest, linkMode)
+      : await source.writeFile(skill, file, dest);
+    const written = await fs.stat(dest);
+    const { size, hash } = skill.entries[file];
+    if (written.size !== size) {
+      throw new Error(
+        `${key} is ${written.size} bytes but the catalog says ${size}; ` +
+          "the skill source changed after the catalog was built"
+      );
+    }
+    manifest.files[key] = {
+      size: written.size,
+      mtime: Math.floor(written.mtimeMs),
+      hash,
+    };
+    stats[how]++;
+  }
+
+  // Drop manifest entries for stale files that are already gone from disk.
+  if (plan.prune) {
+    for (const key of Object.keys(manifest.files)) {
+      const file = key.slice(skill.name.length + 1);
+      if (key.startsWith(`${skill.name}/`) && !skill.entries[file]) {
+        delete manifest.files[key];
+      }
+    }
+    if (Object.keys(skill.entries).length === 0) {
+      await removeEmptyDirs(destDir, targetPath);
+    }
+  }
+
+  return stats;
+}
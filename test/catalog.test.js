@@ -0,0 +1,81 @@
+import { test } from "node:test";
+import assert from "node:assert/strict";
+import { join } from "path";
+import fs from "fs/promises";
+import { createSkillHome } from "../scripts/fixtures.js";
+import { buildCatalog, loadCatalog } from "../src/lib/catalog.js";
+import { tempDir } from "./helpers.js";
+
+async function setup(t) {
+  const root = await tempDir(t);
+  await createSkillHome(root, { skills: 2, files: 2, bytes: 10 });
+  return {
+    source: join(root, ".claude/skills"),
+    catalogPath: join(root, "skills-catalog.json"),
+  };
+}
+
+test("buildCatalog reads descriptions from SKILL.md frontmatter", async (t) => {
+  const { source } = await setup(t);
+  await fs.writeFile(
+    join(source, "skill-0/SKILL.md"),
+    "---\nname: skill-0\ndescription: >\n  Folded\n  description\n---\n"
+  );
+  const { skills } = await buildCatalog(source);
+  assert.deepEqual(
+    skills.map(({ name, description, files }) => ({
+      name,
+      description,
+      files,
+    })),
+    [
+      { name: "skill-0", description: "Folded description", files: 2 },
+      { name: "skill-1", description: "Synthetic skill 1", files: 2 },
+    ]
+  );
+});
+
+test("loadCatalog uses a catalog newer than the tree", async (t) => {
+  const { source, catalogPath } = await setup(t);
+  const catalog = await loadCatalog(catalogPath, source);
+  assert.deepEqual(catalog, await buildCatalog(source));
+
+  await fs.writeFile(
+    catalogPath,
+    JSON.stringify({ ...catalog, skills: [catalog.skills[0]] })
+  );
+  const { skills } = await loadCatalog(catalogPath, source);
+  assert.deepEqual(
+    skills.map((skill) => skill.name),
+    ["skill-0"]
+  );
+});
+
+test("loadCatalog rebuilds a catalog older than the tree", async (t) => {
+  const { source, catalogPath } = await setup(t);
+  const past = new Date(Date.now() - 60_000);
+  await fs.utimes(catalogPath, past, past);
+  await fs.writeFile(join(source, "skill-1/SKILL.md"), "edited");
+
+  const { skills } = await loadCatalog(catalogPath, source);
+  assert.equal(skills[1].entries["SKILL.md"].size, "edited".length);
+});
+
+test("loadCatalog builds the catalog when none exists", async (t) => {
+  const { source, catalogPath } = await setup(t);
+  await fs.rm(catalogPath);
+  const { skills } = await loadCatalog(catalogPath, source);
+  assert.equal(skills.length, 2);
+});
+
+test("loadCatalog rebuilds a truncated catalog", async (t) => {
+  const { source, catalogPath } = await setup(t);
+  const text = await fs.readFile(catalogPath, "utf8");
+  await fs.writeFile(catalogPath, text.slice(0, text.length / 2));
+
+  const { skills } = await loadCatalog(catalogPath, source);
+  assert.deepEqual(
+    skills.map((skill) => skill.name),
+    ["skill-0", "skill-1"]
+  );
+});
@@ -0,0 +1,51 @@
+import { spawnSync } from "child_process";
+import { tmpdir } from "os";
+import { join } from "path";
+import fs from "fs/promises";
+
+const COMMANDS = {
+  init: "../src/commands/init.js",
+  add: "../src/commands/init.js",
+  list: "../src/commands/list.js",
+};
+
+export async function tempDir(t) {
+  const dir = await fs.mkdtemp(join(tmpdir(), "solo-dev-skills-"));
+  t.after(() => fs.rm(dir, { recursive: true, force: true }));
+  return dir;
+}
+
+// Runs `init`, `add` or `list` from src/commands in a fresh process (the
+// skill source is memoized per process), with `home` as
+// SOLO_DEV_SKILLS_HOME. Skips bin/cli.js so commander is not needed.
+export function run(command, { cwd, home, skills = [], ...options }) {
+  const args =
+    command === "add"
+      ? `${JSON.stringify(skills)}, ${JSON.stringify(options)}`
+      : JSON.stringify(options);
+  const url = new URL(COMMANDS[command], import.meta.url).href;
+  const script = `const m = await import(${JSON.stringify(url)});
+await m.${command}(${args});`;
+  const result = spawnSync(
+    process.execPath,
+    ["--input-type=module", "-e", script],
+    {
+      cwd,
+      encoding: "utf8",
+      env: { ...process.env, SOLO_DEV_SKILLS_HOME: home },
+    }
+  );
+  return {
+    code: result.status,
+    stdout: result.stdout,
+    stderr: result.stderr,
+  };
+}
+
+export async function readJson(path) {
+  return JSON.parse(await fs.readFile(path, "utf8"));
+}
+
+export async function exists(path) {
+  return fs.stat(path).then(() => true, () => false);
+}
@@ -0,0 +1,315 @@
+import { test } from "node:test";
+import assert from "node:assert/strict";
+import { join } from "path";
+import fs from "fs/promises";
+import { createSkillHome } from "../scripts/fixtures.js";
+import { buildCatalog } from "../src/lib/catalog.js";
+import { writePack } from "../src/lib/pack.js";
+import { MANIFEST_FILE } from "../src/lib/sync.js";
+import { exists, readJson, run, tempDir } from "./helpers.js";
+
+const SHAPE = { skills: 2, files: 4, bytes: 64, depth: 2 };
+
+async function setup(t, shape = {}) {
+  const dir = await tempDir(t);
+  const home = join(dir, "home");
+  const cwd = join(dir, "project");
+  await fs.mkdir(cwd, { recursive: true });
+  await createSkillHome(home, { ...SHAPE, ...shape });
+  return { home, cwd };
+}
+
+async function setFutureMtime(path) {
+  const future = new Date(Date.now() + 60_000);
+  await fs.utimes(path, future, future);
+}
+
+test("init copies every skill and writes a manifest", async (t) => {
+  const { home, cwd } = await setup(t);
+  const { code, stdout } = run("init", { cwd, home, environment: "both" });
+  assert.equal(code, 0);
+  assert.match(stdout, /Files: 16 copied, 0 linked, 0 skipped, 0 deleted/);
+
+  for (const target of [".cursor/skills", ".claude/skills"]) {
+    const manifest = await readJson(join(cwd, target, MANIFEST_FILE));
+    assert.equal(Object.keys(manifest.files).length, 8);
+    assert.equal(
+      await fs.readFile(join(cwd, target, "skill-1/SKILL.md"), "utf8"),
+      await fs.readFile(join(home, ".claude/skills/skill-1/SKILL.md"), "utf8")
+    );
+  }
+});
+
+test("re-running with --sync is a no-op", async (t) => {
+  const { home, cwd } = await setup(t);
+  run("init", { cwd, home, environment: "claude" });
+  const file = join(cwd, ".claude/skills/skill-0/SKILL.md");
+  const before = (await fs.stat(file)).mtimeMs;
+
+  const { code, stdout } = run("init", {
+    cwd,
+    home,
+    environment: "claude",
+    sync: true,
+  });
+  assert.equal(code, 0);
+  assert.match(stdout, /Files: 0 copied, 0 linked, 8 skipped, 0 deleted/);
+  assert.equal((await fs.stat(file)).mtimeMs, before);
+});
+
+test("--sync rewrites files edited locally", async (t) => {
+  const { home, cwd } = await setup(t);
+  run("init", { cwd, home, environment: "claude" });
+  const file = join(cwd, ".claude/skills/skill-0/SKILL.md");
+  await fs.writeFile(file, "edited");
+
+  const { stdout } = run("init", {
+    cwd,
+    home,
+    environment: "claude",
+    sync: true,
+  });
+  assert.match(stdout, /Files: 1 copied, 0 linked, 7 skipped, 0 deleted/);
+  assert.notEqual(await fs.readFile(file, "utf8"), "edited");
+});
+
+test("--prune removes files and skills deleted upstream", async (t) => {
+  const { home, cwd } = await setup(t);
+  run("init", { cwd, home, environment: "both" });
+  const source = join(home, ".claude/skills");
+  await fs.rm(join(source, "skill-1"), { recursive: true });
+  await fs.rm(join(source, "skill-0/references/level-0/ref-1.md"));
+
+  const { code } = run("init", { cwd, home, environment: "both", prune: true });
+  assert.equal(code, 0);
+  for (const target of [".cursor/skills", ".claude/skills"]) {
+    assert.equal(await exists(join(cwd, target, "skill-1")), false);
+    assert.equal(
+      await exists(join(cwd, target, "skill-0/references/level-0/ref-1.md")),
+      false
+    );
+    const { files } = await readJson(join(cwd, target, MANIFEST_FILE));
+    assert.deepEqual(
+      Object.keys(files).filter(
+        (key) => key.startsWith("skill-1/") || key.endsWith("/ref-1.md")
+      ),
+      []
+    );
+  }
+});
+
+test("--prune leaves files it did not install alone", async (t) => {
+  const { home, cwd } = await setup(t);
+  run("init", { cwd, home, environment: "claude" });
+  const own = join(cwd, ".claude/skills/skill-0/notes.md");
+  await fs.writeFile(own, "mine");
+
+  run("init", { cwd, home, environment: "claude", prune: true });
+  assert.equal(await fs.readFile(own, "utf8"), "mine");
+});
+
+test("hardlink mode links the second target to the first", async (t) => {
+  const { home, cwd } = await setup(t);
+  const { code, stdout } = run("init", {
+    cwd,
+    home,
+    environment: "both",
+    linkMode: "hardlink",
+  });
+  assert.equal(code, 0);
+  assert.match(stdout, /Files: 8 copied, 8 linked/);
+  const [cursor, claude] = await Promise.all(
+    [".cursor", ".claude"].map((dir) =>
+      fs.stat(join(cwd, dir, "skills/skill-0/SKILL.md"))
+    )
+  );
+  assert.equal(cursor.ino, claude.ino);
+});
+
+test("a failed job is reported without stopping the others", async (t) => {
+  const { home, cwd } = await setup(t);
+  // A file where the skill directory should go makes skill-0's primary
+  // copy fail; the second target must still be written from the source.
+  await fs.mkdir(join(cwd, ".cursor/skills"), { recursive: true });
+  await fs.writeFile(join(cwd, ".cursor/skills/skill-0"), "");
+
+  const { code, stderr } = run("init", {
+    cwd,
+    home,
+    environment: "both",
+    linkMode: "hardlink",
+  });
+  assert.equal(code, 1);
+  assert.match(stderr, /1 copy job\(s\) failed/);
+  assert.equal(
+    await exists(join(cwd, ".claude/skills/skill-0/SKILL.md")),
+    true
+  );
+  assert.equal(
+    await exists(join(cwd, ".cursor/skills/skill-1/SKILL.md")),
+    true
+  );
+});
+
+test("a catalog older than the skill tree is ignored", async (t) => {
+  const { home, cwd } = await setup(t);
+  const file = join(home, ".claude/skills/skill-0/SKILL.md");
+  await fs.writeFile(file, "---\ndescription: changed\n---\nlonger body");
+  await setFutureMtime(file);
+
+  const { code, stderr } = run("init", { cwd, home, environment: "claude" });
+  assert.equal(code, 0, stderr);
+  assert.equal(
+    await fs.readFile(join(cwd, ".claude/skills/skill-0/SKILL.md"), "utf8"),
+    "---\ndescription: changed\n---\nlonger body"
+  );
+});
+
+test("add installs each named skill once", async (t) => {
+  const { home, cwd } = await setup(t);
+  const { code, stdout } = run("add", {
+    cwd,
+    home,
+    skills: ["skill-1", "skill-1", "skill-0"],
+    environment: "claude",
+  });
+  assert.equal(code, 0);
+  assert.match(stdout, /Added 2 skill\(s\) for claude/);
+  assert.match(stdout, /Files: 8 copied/);
+});
+
+test("add rejects unknown skills", async (t) => {
+  const { home, cwd } = await setup(t);
+  const { code, stderr } = run("add", {
+    cwd,
+    home,
+    skills: ["missing"],
+    environment: "claude",
+  });
+  assert.equal(code, 1);
+  assert.match(stderr, /Unknown skills: missing/);
+});
+
+test("the skill tree wins over a leftover skills.pack", async (t) => {
+  const { home, cwd } = await setup(t);
+  const source = join(home, ".claude/skills");
+  const catalog = await buildCatalog(source);
+  await writePack(join(home, "skills.pack"), source, catalog);
+  const file = join(source, "skill-0/SKILL.md");
+  await fs.writeFile(file, "from the tree");
+  await setFutureMtime(file);
+
+  run("init", { cwd, home, environment: "claude" });
+  assert.equal(
+    await fs.readFile(join(cwd, ".claude/skills/skill-0/SKILL.md"), "utf8"),
+    "from the tree"
+  );
+});
+
+test("skills come from skills.pack when there is no tree", async (t) => {
+  const { home, cwd } = await setup(t, { pack: true });
+  assert.equal(await exists(join(home, ".claude")), false);
+
+  const { code, stdout } = run("init", { cwd, home, environment: "claude" });
+  assert.equal(code, 0);
+  assert.match(stdout, /Files: 8 copied/);
+  const body = await fs.readFile(
+    join(cwd, ".claude/skills/skill-1/references/level-0/ref-1.md"),
+    "utf8"
+  );
+  assert.equal(body, `1\n${"x".repeat(SHAPE.bytes)}`);
+});
+
+test("--dry-run counts linked targets as 0 bytes", async (t) => {
+  const { home, cwd } = await setup(t);
+  const plan = (linkMode) => {
+    const { code, stdout } = run("init", {
+      cwd,
+      home,
+      environment: "both",
+      linkMode,
+      dryRun: true,
+      json: true,
+    });
+    assert.equal(code, 0);
+    return JSON.parse(stdout);
+  };
+
+  const copy = plan("copy");
+  const linked = plan("hardlink");
+  assert.equal(await exists(join(cwd, ".cursor")), false);
+  assert.equal(await exists(join(cwd, ".claude")), false);
+
+  assert.equal(linked.totals.create, copy.totals.create);
+  assert.equal(linked.totals.bytes * 2, copy.totals.bytes);
+  for (const row of linked.plan) {
+    const second = row.target === ".claude/skills";
+    assert.equal(Boolean(row.linked), second);
+    if (second) assert.equal(row.bytes, 0);
+  }
+});
+
+test("--dry-run --sync reports an installed tree as unchanged", async (t) => {
+  const { home, cwd } = await setup(t);
+  run("init", { cwd, home, environment: "claude" });
+  await fs.writeFile(join(cwd, ".claude/skills/skill-0/SKILL.md"), "edited");
+
+  const { stdout } = run("init", {
+    cwd,
+    home,
+    environment: "claude",
+    sync: true,
+    dryRun: true,
+    json: true,
+  });
+  const { totals } = JSON.parse(stdout);
+  assert.equal(totals.update, 1);
+  assert.equal(totals.unchanged, 7);
+  assert.equal(totals.create, 0);
+  assert.equal(
+    await fs.readFile(join(cwd, ".claude/skills/skill-0/SKILL.md"), "utf8"),
+    "edited"
+  );
+});
+
+test("--projects installs into every matching project", async (t) => {
+  const { home, cwd } = await setup(t);
+  for (const name of ["a", "b", ".hidden"]) {
+    await fs.mkdir(join(cwd, "services", name), { recursive: true });
+  }
+
+  const { code, stdout } = run("init", {
+    cwd,
+    home,
+    environment: "claude",
+    projects: "services/*",
+  });
+  assert.equal(code, 0);
+  assert.match(stdout, /Projects: 2 succeeded, 0 failed/);
+  assert.match(stdout, /Files: 16 copied/);
+  for (const name of ["a", "b"]) {
+    assert.equal(
+      await exists(join(cwd, "services", name, ".claude/skills/skill-0")),
+      true
+    );
+  }
+  assert.equal(await exists(join(cwd, "services/.hidden/.claude")), false);
+});
+
+test("--projects reports a failed skill read", async (t) => {
+  const { home, cwd } = await setup(t);
+  await fs.mkdir(join(cwd, "a"));
+  // A catalog that is still considered fresh but lists a file that is gone.
+  await fs.rm(join(home, ".claude/skills/skill-0/SKILL.md"));
+  await setFutureMtime(join(home, "skills-catalog.json"));
+
+  const { code, stderr } = run("init", {
+    cwd,
+    home,
+    environment: "claude",
+    projects: "a",
+  });
+  assert.equal(code, 1);
+  assert.match(stderr, /✗ Could not read skills: ENOENT/);
+  assert.doesNotMatch(stderr, /\n\s+at /);
+});
@@ -0,0 +1,62 @@
+import { test } from "node:test";
+import assert from "node:assert/strict";
+import { join } from "path";
+import fs from "fs/promises";
+import { placeFile } from "../src/lib/link.js";
+import { tempDir } from "./helpers.js";
+
+async function setup(t) {
+  const dir = await tempDir(t);
+  const src = join(dir, "src.md");
+  await fs.writeFile(src, "source");
+  await fs.mkdir(join(dir, "out"));
+  return { src, dest: join(dir, "out/dest.md") };
+}
+
+test("copy mode copies the file", async (t) => {
+  const { src, dest } = await setup(t);
+  assert.equal(await placeFile(src, dest, "copy"), "copied");
+  assert.equal(await fs.readFile(dest, "utf8"), "source");
+  assert.notEqual((await fs.stat(dest)).ino, (await fs.stat(src)).ino);
+});
+
+test("hardlink mode links to the same inode", async (t) => {
+  const { src, dest } = await setup(t);
+  assert.equal(await placeFile(src, dest, "hardlink"), "linked");
+  assert.equal((await fs.stat(dest)).ino, (await fs.stat(src)).ino);
+});
+
+test("symlink mode creates a relative link", async (t) => {
+  const { src, dest } = await setup(t);
+  assert.equal(await placeFile(src, dest, "symlink"), "linked");
+  assert.equal(await fs.readlink(dest), "../src.md");
+  assert.equal(await fs.readFile(dest, "utf8"), "source");
+});
+
+test("reflink mode reports a fallback copy as copied", async (t) => {
+  const { src, dest } = await setup(t);
+  const how = await placeFile(src, dest, "reflink");
+  assert.ok(how === "linked" || how === "copied");
+  assert.equal(await fs.readFile(dest, "utf8"), "source");
+
+  // Whichever happened, the copy must not share data with the source.
+  await fs.writeFile(dest, "changed");
+  assert.equal(await fs.readFile(src, "utf8"), "source");
+});
+
+test("an existing link is replaced, not written through", async (t) => {
+  const { src, dest } = await setup(t);
+  await placeFile(src, dest, "hardlink");
+  const other = join(src, "../other.md");
+  await fs.writeFile(other, "other");
+
+  await placeFile(other, dest, "copy");
+  assert.equal(await fs.readFile(dest, "utf8"), "other");
+  assert.equal(await fs.readFile(src, "utf8"), "source");
+});
+
+test("errors other than unsupported links are thrown", async (t) => {
+  const { src } = await setup(t);
+  const dest = join(src, "../missing/dest.md");
+  await assert.rejects(placeFile(src, dest, "hardlink"), { code: "ENOENT" });
+});
@@ -0,0 +1,74 @@
+import { test } from "node:test";
+import assert from "node:assert/strict";
+import { join } from "path";
+import fs from "fs/promises";
+import { createSkillHome } from "../scripts/fixtures.js";
+import { run, tempDir } from "./helpers.js";
+
+async function setup(t, options = {}) {
+  const dir = await tempDir(t);
+  const home = join(dir, "home");
+  await createSkillHome(home, { skills: 3, files: 2, bytes: 100, ...options });
+  return { cwd: dir, home };
+}
+
+test("list prints every skill name", async (t) => {
+  const { cwd, home } = await setup(t);
+  const { code, stdout } = run("list", { cwd, home });
+  assert.equal(code, 0);
+  assert.match(stdout, /- skill-0\n {2}- skill-1\n {2}- skill-2\n/);
+  assert.match(stdout, /Total: 3 skills/);
+});
+
+test("list --long shows file count, size and description", async (t) => {
+  const { cwd, home } = await setup(t);
+  const { stdout } = run("list", { cwd, home, long: true });
+  assert.match(stdout, /skill-1 +2 files +\d+ B {2}Synthetic skill 1\n/);
+});
+
+test("list --json prints the catalog without file entries", async (t) => {
+  for (const pack of [false, true]) {
+    const { cwd, home } = await setup(t, { pack });
+    const { code, stdout } = run("list", { cwd, home, json: true });
+    assert.equal(code, 0);
+    const skills = JSON.parse(stdout);
+    assert.deepEqual(
+      skills.map(({ name, description, files }) => ({
+        name,
+        description,
+        files,
+      })),
+      [0, 1, 2].map((s) => ({
+        name: `skill-${s}`,
+        description: `Synthetic skill ${s}`,
+        files: 2,
+      }))
+    );
+    for (const skill of skills) {
+      assert.equal(skill.entries, undefined);
+      assert.match(skill.hash, /^[0-9a-f]{64}$/);
+      assert.ok(skill.bytes > 200);
+    }
+  }
+});
+
+test("list survives a truncated skills-catalog.json", async (t) => {
+  const { cwd, home } = await setup(t);
+  await fs.writeFile(join(home, "skills-catalog.json"), '{"version":1,"sk');
+
+  for (const options of [{}, { json: true }, { long: true }]) {
+    const { code, stdout, stderr } = run("list", { cwd, home, ...options });
+    assert.equal(code, 0, stderr);
+    assert.match(stdout, /skill-2/);
+  }
+});
+
+test("list without --long or --json reads only skill names", async (t) => {
+  const { cwd, home } = await setup(t);
+  // Not a skill file the catalog could hash, but plain list never looks.
+  await fs.symlink("missing", join(home, ".claude/skills/skill-0/broken.md"));
+
+  const { code, stdout } = run("list", { cwd, home });
+  assert.equal(code, 0);
+  assert.match(stdout, /Total: 3 skills/);
+});
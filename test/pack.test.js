@@ -0,0 +1,76 @@
+import { test } from "node:test";
+import assert from "node:assert/strict";
+import { join } from "path";
+import fs from "fs/promises";
+import { createSkillHome } from "../scripts/fixtures.js";
+import { buildCatalog } from "../src/lib/catalog.js";
+import { openPack, writePack } from "../src/lib/pack.js";
+import { tempDir } from "./helpers.js";
+
+test("a pack round-trips file contents and modes", async (t) => {
+  const dir = await tempDir(t);
+  const source = join(dir, ".claude/skills");
+  await createSkillHome(dir, { skills: 2, files: 3, bytes: 3000 });
+  const script = join(source, "skill-1/references/ref-2.md");
+  await fs.chmod(script, 0o755);
+
+  const catalog = await buildCatalog(source);
+  const packPath = join(dir, "skills.pack");
+  const { files } = await writePack(packPath, source, catalog);
+  assert.equal(files, 6);
+
+  const pack = await openPack(packPath);
+  t.after(() => pack.close());
+  assert.deepEqual(
+    pack.catalog.skills.map(({ name, files, bytes, hash }) => ({
+      name,
+      files,
+      bytes,
+      hash,
+    })),
+    catalog.skills.map(({ name, files, bytes, hash }) => ({
+      name,
+      files,
+      bytes,
+      hash,
+    }))
+  );
+
+  for (const skill of pack.catalog.skills) {
+    for (const [file, entry] of Object.entries(skill.entries)) {
+      const original = await fs.readFile(join(source, skill.name, file));
+      assert.deepEqual(await pack.read(entry), original);
+
+      const dest = join(dir, "out", skill.name, file);
+      await fs.mkdir(join(dest, ".."), { recursive: true });
+      await pack.extract(entry, dest);
+      assert.deepEqual(await fs.readFile(dest), original);
+    }
+  }
+
+  const entry = pack.catalog.skills[1].entries["references/ref-2.md"];
+  assert.equal(entry.mode, 0o755);
+  const { mode } = await fs.stat(join(dir, "out/skill-1/references/ref-2.md"));
+  assert.equal(mode & 0o777, 0o755 & ~process.umask());
+});
+
+test("openPack returns null when there is no pack", async (t) => {
+  const dir = await tempDir(t);
+  assert.equal(await openPack(join(dir, "skills.pack")), null);
+});
+
+test("openPack rejects files that are not skill packs", async (t) => {
+  const dir = await tempDir(t);
+  const packPath = join(dir, "skills.pack");
+  await fs.writeFile(packPath, "not a pack at all");
+  await assert.rejects(openPack(packPath), /is not a skill pack/);
+});
+
+test("openPack rejects a truncated index", async (t) => {
+  const dir = await tempDir(t);
+  await createSkillHome(dir, { skills: 1, files: 2, bytes: 10, pack: true });
+  const packPath = join(dir, "skills.pack");
+  const data = await fs.readFile(packPath);
+  await fs.writeFile(packPath, data.subarray(0, 20));
+  await assert.rejects(openPack(packPath), /Truncated skill pack/);
+});
@@ -0,0 +1,57 @@
+import { test } from "node:test";
+import assert from "node:assert/strict";
+import { setTimeout as sleep } from "timers/promises";
+import { defaultJobs, runPool } from "../src/lib/pool.js";
+
+test("results come back in task order", async () => {
+  const delays = [30, 5, 20, 0, 10];
+  const results = await runPool(
+    delays.map((ms, i) => async () => {
+      await sleep(ms);
+      return i;
+    }),
+    3
+  );
+  assert.deepEqual(
+    results.map((result) => result.value),
+    [0, 1, 2, 3, 4]
+  );
+});
+
+test("at most `limit` tasks run at once", async () => {
+  let running = 0;
+  let peak = 0;
+  const task = async () => {
+    peak = Math.max(peak, ++running);
+    await sleep(5);
+    running--;
+  };
+  await runPool(Array.from({ length: 12 }, () => task), 4);
+  assert.equal(peak, 4);
+});
+
+test("a failing task does not stop the others", async () => {
+  let ran = 0;
+  const results = await runPool(
+    [0, 1, 2, 3].map((i) => async () => {
+      ran++;
+      if (i === 1) throw new Error("boom");
+      return i;
+    }),
+    1
+  );
+  assert.equal(ran, 4);
+  assert.deepEqual(
+    results.map((result) => result.status),
+    ["fulfilled", "rejected", "fulfilled", "fulfilled"]
+  );
+  assert.equal(results[1].reason.message, "boom");
+});
+
+test("an empty task list resolves to no results", async () => {
+  assert.deepEqual(await runPool([], 4), []);
+});
+
+test("defaultJobs is a positive integer", () => {
+  assert.ok(Number.isInteger(defaultJobs()) && defaultJobs() > 0);
+});
@@ -0,0 +1,109 @@
+import { test } from "node:test";
+import assert from "node:assert/strict";
+import { join } from "path";
+import { setTimeout as sleep } from "timers/promises";
+import { createSkillHome } from "../scripts/fixtures.js";
+import { createProfiler, writeTrace } from "../src/lib/profiler.js";
+import { readJson, run, tempDir } from "./helpers.js";
+
+test("a disabled profiler only calls through", async () => {
+  const profiler = createProfiler(false);
+  assert.equal(profiler.enabled, false);
+  assert.equal(await profiler.span("copy", "x", async () => 42), 42);
+  assert.equal(profiler.events, undefined);
+});
+
+test("spans record timing, lanes and described results", async () => {
+  const profiler = createProfiler(true);
+  const job = (name, ms) =>
+    profiler.span(
+      "copy",
+      name,
+      async () => {
+        await sleep(ms);
+        return ms;
+      },
+      (ms) => ({ ms })
+    );
+  await Promise.all([job("a", 20), job("b", 10)]);
+  await job("c", 0);
+
+  const byName = Object.fromEntries(
+    profiler.events.map((event) => [event.name, event])
+  );
+  assert.notEqual(byName.a.lane, byName.b.lane);
+  assert.equal(byName.c.lane, 0);
+  assert.deepEqual(byName.a.args, { ms: 20 });
+  assert.ok(byName.a.duration >= 15);
+  assert.ok(byName.c.start >= byName.a.start + byName.a.duration);
+});
+
+test("a failed span is still recorded", async () => {
+  const profiler = createProfiler(true);
+  await assert.rejects(
+    profiler.span(
+      "copy",
+      "bad",
+      async () => {
+        throw new Error("boom");
+      },
+      () => ({ never: true })
+    ),
+    /boom/
+  );
+  assert.equal(profiler.events.length, 1);
+  assert.deepEqual(profiler.events[0].args, {});
+});
+
+test("writeTrace writes Chrome trace events", async (t) => {
+  const dir = await tempDir(t);
+  const profiler = createProfiler(true);
+  await profiler.span("plan", "skill-0", async () => {});
+  await writeTrace(profiler, join(dir, "trace.json"));
+
+  const { traceEvents, displayTimeUnit } = await readJson(
+    join(dir, "trace.json")
+  );
+  assert.equal(displayTimeUnit, "ms");
+  assert.equal(traceEvents.length, 1);
+  assert.deepEqual(
+    { ...traceEvents[0], ts: 0, dur: 0 },
+    {
+      name: "skill-0",
+      cat: "plan",
+      ph: "X",
+      ts: 0,
+      dur: 0,
+      pid: process.pid,
+      tid: 0,
+      args: {},
+    }
+  );
+});
+
+test("init --profile --trace reports phases and skills", async (t) => {
+  const dir = await tempDir(t);
+  const home = join(dir, "home");
+  await createSkillHome(home, { skills: 2, files: 3, bytes: 10 });
+  const trace = join(dir, "init.json");
+
+  const { code, stdout } = run("init", {
+    cwd: dir,
+    home,
+    environment: "both",
+    profile: true,
+    trace,
+  });
+  assert.equal(code, 0);
+  assert.match(stdout, /Profile by phase:/);
+  assert.match(stdout, /\n {2}copy +4 /);
+  assert.match(stdout, /Profile by skill \(all targets\):/);
+  assert.match(stdout, /\n {2}skill-1 +6 /);
+  assert.match(stdout, /Wrote trace to /);
+
+  const { traceEvents } = await readJson(trace);
+  const categories = new Set(traceEvents.map((event) => event.cat));
+  for (const category of ["validation", "copy", "manifest"]) {
+    assert.ok(categories.has(category), category);
+  }
+});
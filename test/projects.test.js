@@ -0,0 +1,74 @@
+import { test } from "node:test";
+import assert from "node:assert/strict";
+import { join } from "path";
+import fs from "fs/promises";
+import { resolveProjects } from "../src/lib/projects.js";
+import { tempDir } from "./helpers.js";
+
+async function tree(t) {
+  const root = await tempDir(t);
+  for (const dir of [
+    "apps/web",
+    "apps/api",
+    "apps/.cache",
+    "libs/a1",
+    "libs/b2",
+    "libs/c3",
+    "deep/x/y/z",
+    "deep/node_modules/z",
+    "deep/.git/z",
+  ]) {
+    await fs.mkdir(join(root, dir), { recursive: true });
+  }
+  await fs.writeFile(join(root, "apps/README.md"), "");
+  return root;
+}
+
+async function match(t, spec) {
+  const root = await tree(t);
+  const projects = await resolveProjects(spec, root);
+  return projects.map((project) => project.slice(root.length + 1));
+}
+
+test("* matches directories only and skips dot-directories", async (t) => {
+  assert.deepEqual(await match(t, "apps/*"), ["apps/api", "apps/web"]);
+});
+
+test("a leading dot in the segment matches dot-directories", async (t) => {
+  assert.deepEqual(await match(t, "apps/.*"), ["apps/.cache"]);
+});
+
+test("?, [...] and [!...] match within one segment", async (t) => {
+  assert.deepEqual(await match(t, "libs/?1"), ["libs/a1"]);
+  assert.deepEqual(await match(t, "libs/[ab]?"), ["libs/a1", "libs/b2"]);
+  assert.deepEqual(await match(t, "libs/[!ab]?"), ["libs/c3"]);
+});
+
+test("{a,b} matches any of the alternatives", async (t) => {
+  assert.deepEqual(await match(t, "{apps,libs}/{web,c3}"), [
+    "apps/web",
+    "libs/c3",
+  ]);
+});
+
+test("** spans any depth, skipping node_modules and dot-dirs", async (t) => {
+  assert.deepEqual(await match(t, "deep/**/z"), ["deep/x/y/z"]);
+});
+
+test("a directory path resolves to itself", async (t) => {
+  assert.deepEqual(await match(t, "apps/web"), ["apps/web"]);
+});
+
+test("no matches resolve to an empty list", async (t) => {
+  assert.deepEqual(await match(t, "missing/*"), []);
+});
+
+test("a file lists one project per line", async (t) => {
+  const root = await tree(t);
+  await fs.writeFile(
+    join(root, "projects.txt"),
+    "# services\napps/web\n\n  libs/a1  \napps/web\n"
+  );
+  const projects = await resolveProjects("projects.txt", root);
+  assert.deepEqual(projects, [join(root, "apps/web"), join(root, "libs/a1")]);
+});